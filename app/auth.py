@@ -1,14 +1,37 @@
 """API Key authentication for protected endpoints."""
 
-from typing import Optional
+import hmac
+import time
+from typing import Dict, Optional
 from fastapi import Header, HTTPException, status
 from app.config import settings
 
+# Short-lived cache of recently validated API keys (key -> validation timestamp)
+_VALID_KEY_TTL_SECONDS = 30.0
+_VALID_KEY_CACHE_MAX_SIZE = 1024
+_valid_key_cache: Dict[str, float] = {}
+
+
+def _is_allowed_key(api_key: str) -> bool:
+    """Check an API key against the allowed set using constant-time comparison."""
+    candidate = api_key.encode("utf-8")
+    matched = False
+    for allowed_key in settings.allowed_api_keys_set:
+        if hmac.compare_digest(candidate, allowed_key.encode("utf-8")):
+            matched = True
+    return matched
+
 
 async def verify_api_key(x_api_key: Optional[str] = Header(None)) -> str:
     """
     Verify API key from X-API-Key header.
 
+    Successful validations are cached for a few seconds so bursts of
+    requests from the same client skip the full check.
+
+    Kept as ``async def`` on purpose: it never blocks, and FastAPI would
+    dispatch a plain ``def`` dependency to the threadpool on every request.
+
     Args:
         x_api_key: API key from request header
 
@@ -25,12 +48,21 @@ async def verify_api_key(x_api_key: Optional[str] = Header(None)) -> str:
             headers={"WWW-Authenticate": "ApiKey"},
         )
 
-    allowed_keys = settings.allowed_api_keys_list
+    now = time.monotonic()
+    validated_at = _valid_key_cache.get(x_api_key)
+    if validated_at is not None and now - validated_at < _VALID_KEY_TTL_SECONDS:
+        return x_api_key
 
-    if x_api_key not in allowed_keys:
+    if not _is_allowed_key(x_api_key):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Invalid API key",
         )
 
+    # Refresh entry and evict oldest (FIFO) if the cache grows too large
+    _valid_key_cache.pop(x_api_key, None)
+    _valid_key_cache[x_api_key] = now
+    if len(_valid_key_cache) > _VALID_KEY_CACHE_MAX_SIZE:
+        _valid_key_cache.pop(next(iter(_valid_key_cache)))
+
     return x_api_key
@@ -1,6 +1,7 @@
 """Configuration management using Pydantic Settings."""
 
-from typing import List
+from functools import cached_property
+from typing import FrozenSet
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -32,15 +33,28 @@ class Settings(BaseSettings):
     # Whisper Model Configuration
     whisper_model: str = Field(
         default="small",
-        description="Whisper model size (tiny, base, small, medium, large)"
+        description="Whisper model size (tiny, base, small, medium, large-v3), distilled "
+                    "variant (distil-large-v3, English only) or a Hugging Face repo ID "
+                    "(e.g. Systran/faster-distil-whisper-large-v3)"
     )
     whisper_device: str = Field(
         default="auto",
         description="Device for inference (auto, cuda, cpu)"
     )
     whisper_compute_type: str = Field(
-        default="int8",
-        description="Compute type for inference (int8, float16, float32)"
+        default="auto",
+        description="Compute type for inference (auto, int8, int8_float16, float16, float32). "
+                    "auto uses int8_float16 on GPU and int8 on CPU"
+    )
+    whisper_num_workers: int = Field(
+        default=1,
+        ge=1,
+        description="Number of CTranslate2 workers for parallel decoding"
+    )
+    whisper_cpu_threads: int = Field(
+        default=0,
+        ge=0,
+        description="CPU threads per CTranslate2 worker (0 = CTranslate2 default of 4)"
     )
 
     # Transcription Settings
@@ -66,26 +80,50 @@ class Settings(BaseSettings):
         default="mp3,wav,m4a,ogg,flac,webm",
         description="Comma-separated list of allowed audio formats"
     )
+    stage_uploads_to_temp_file: bool = Field(
+        default=False,
+        description="Copy uploads to a temp file instead of transcribing the upload as received"
+    )
+    upload_temp_dir: str = Field(
+        default="/tmp",
+        description="Directory for staged uploads when stage_uploads_to_temp_file is enabled"
+    )
 
     # Performance
     enable_vad_filter: bool = Field(
         default=True,
         description="Enable Voice Activity Detection filter"
     )
+    vad_min_silence_duration_ms: int = Field(
+        default=2000,
+        ge=0,
+        description="Minimum silence (ms) for the VAD filter to split speech "
+                    "(lower = more, shorter segments)"
+    )
+    vad_speech_pad_ms: int = Field(
+        default=400,
+        ge=0,
+        description="Padding (ms) added around each speech chunk detected by VAD"
+    )
+    transcribe_concurrency: int = Field(
+        default=1,
+        ge=1,
+        description="Maximum number of transcriptions running concurrently"
+    )
 
-    @property
-    def allowed_api_keys_list(self) -> List[str]:
-        """Parse allowed API keys from comma-separated string."""
-        return [key.strip() for key in self.allowed_api_keys.split(",") if key.strip()]
+    @cached_property
+    def allowed_api_keys_set(self) -> FrozenSet[str]:
+        """Parse allowed API keys from comma-separated string (cached)."""
+        return frozenset(key.strip() for key in self.allowed_api_keys.split(",") if key.strip())
 
-    @property
-    def allowed_formats_list(self) -> List[str]:
-        """Parse allowed audio formats from comma-separated string."""
-        return [fmt.strip().lower() for fmt in self.allowed_audio_formats.split(",") if fmt.strip()]
+    @cached_property
+    def allowed_formats_set(self) -> FrozenSet[str]:
+        """Parse allowed audio formats from comma-separated string (cached)."""
+        return frozenset(fmt.strip().lower() for fmt in self.allowed_audio_formats.split(",") if fmt.strip())
 
-    @property
+    @cached_property
     def max_file_size_bytes(self) -> int:
-        """Get max file size in bytes."""
+        """Get max file size in bytes (cached)."""
         return self.max_file_size_mb * 1024 * 1024
 
 
@@ -1,9 +1,13 @@
 """FastAPI application entry point for Newrality Transcribe."""
 
+import anyio
+import anyio.to_thread
+import orjson
 import structlog
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, UploadFile, File, Depends, HTTPException, status, Query
-from fastapi.responses import JSONResponse
+from functools import partial
+from fastapi import FastAPI, Request, UploadFile, File, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from app import __version__
@@ -18,6 +22,7 @@ from app.auth import verify_api_key
 from app.utils import (
     generate_request_id,
     validate_audio_file,
+    check_upload_size,
     save_upload_to_temp,
     cleanup_temp_file,
 )
@@ -28,12 +33,33 @@ structlog.configure(
     processors=[
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.add_log_level,
-        structlog.processors.JSONRenderer()
-    ]
+        structlog.processors.JSONRenderer(serializer=orjson.dumps)
+    ],
+    # orjson emits bytes, so write them straight to stdout's binary buffer
+    logger_factory=structlog.BytesLoggerFactory(),
 )
 
 logger = structlog.get_logger()
 
+# Bounds concurrent transcriptions; extra requests queue for a worker thread
+TRANSCRIBE_LIMITER = anyio.CapacityLimiter(settings.transcribe_concurrency)
+
+# Largest request body accepted on upload routes: file limit plus multipart framing
+MAX_UPLOAD_REQUEST_BYTES = settings.max_file_size_bytes + 64 * 1024
+
+# Pre-serialized /health bodies, one per status (model and device are fixed at startup)
+_HEALTH_PAYLOADS = {
+    health_status: orjson.dumps(
+        HealthCheckResponse(
+            status=health_status,
+            model=transcription_service.model_name,
+            device=transcription_service.device,
+            version=__version__
+        ).model_dump()
+    )
+    for health_status in ("starting", "loading", "ready", "unhealthy")
+}
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -60,9 +86,47 @@ app = FastAPI(
     description="Self-hosted audio transcription microservice using faster-whisper",
     version=__version__,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# Add CORS middleware
+
+class RejectOversizeUploadsMiddleware:
+    """
+    Reject transcription uploads whose Content-Length exceeds the limit.
+
+    Pure ASGI so that every other request (e.g. /health) passes straight
+    through to the inner app without extra per-request overhead.
+    """
+
+    def __init__(self, app, max_bytes: int, path: str = "/api/v1/transcribe"):
+        self.app = app
+        self.max_bytes = max_bytes
+        self.path = path
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] == "POST" and scope["path"] == self.path:
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > self.max_bytes:
+                        response = ORJSONResponse(
+                            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                            content=ErrorResponse(
+                                error=HTTPException.__name__,
+                                detail=f"File too large. Maximum size: {settings.max_file_size_mb}MB",
+                                request_id=generate_request_id()
+                            ).model_dump()
+                        )
+                        await response(scope, receive, send)
+                        return
+                    break
+
+        await self.app(scope, receive, send)
+
+
+# Reject oversize uploads before the body is read
+app.add_middleware(RejectOversizeUploadsMiddleware, max_bytes=MAX_UPLOAD_REQUEST_BYTES)
+
+# Add CORS middleware (registered last so it also wraps early rejections)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Configure appropriately for production
@@ -80,24 +144,17 @@ async def health_check():
     Returns service status and model information.
     Returns 'healthy' immediately even if model is still loading in background.
     """
-    model_info = transcription_service.get_model_info()
-
     # Determine status: healthy if server is running (even if model is loading)
     if transcription_service.load_error:
-        status = "unhealthy"
+        health_status = "unhealthy"
     elif transcription_service.loading:
-        status = "loading"
-    elif model_info["loaded"]:
-        status = "ready"
+        health_status = "loading"
+    elif transcription_service.model is not None:
+        health_status = "ready"
     else:
-        status = "starting"
+        health_status = "starting"
 
-    return HealthCheckResponse(
-        status=status,
-        model=model_info["model"],
-        device=model_info["device"],
-        version=__version__
-    )
+    return Response(content=_HEALTH_PAYLOADS[health_status], media_type="application/json")
 
 
 @app.get("/api/v1/models", response_model=ModelsResponse)
@@ -121,6 +178,7 @@ async def list_models():
     dependencies=[Depends(verify_api_key)]
 )
 async def transcribe_audio(
+    request: Request,
     file: UploadFile = File(..., description="Audio file to transcribe"),
     language: str = Query(
         None,
@@ -156,6 +214,7 @@ async def transcribe_audio(
     Maximum file size: 25MB (configurable).
     """
     request_id = generate_request_id()
+    request.state.request_id = request_id
     temp_file_path = None
 
     try:
@@ -168,26 +227,36 @@ async def transcribe_audio(
         )
 
         # Validate audio file
-        validate_audio_file(file)
+        file_ext = validate_audio_file(file)
 
-        # Save uploaded file to temp directory
-        temp_file_path, file_size = await save_upload_to_temp(file)
+        # Hand Starlette's spooled upload straight to the worker, or copy it
+        # to our own temp file if configured
+        if not settings.stage_uploads_to_temp_file:
+            file_size = check_upload_size(file)
+            audio_source = file.file
+        else:
+            temp_file_path, file_size = await save_upload_to_temp(file, file_ext)
+            audio_source = temp_file_path
 
         logger.info(
-            "File saved to temp",
+            "Upload received",
             request_id=request_id,
             temp_path=temp_file_path,
             file_size_bytes=file_size
         )
 
-        # Perform transcription
-        text, detected_language, duration, segments = transcription_service.transcribe(
-            audio_path=temp_file_path,
-            language=language,
-            temperature=temperature,
-            beam_size=beam_size,
-            initial_prompt=initial_prompt,
-            include_segments=include_segments
+        # Perform transcription in a worker thread to keep the event loop free
+        text, detected_language, duration, segments = await anyio.to_thread.run_sync(
+            partial(
+                transcription_service.transcribe,
+                audio=audio_source,
+                language=language,
+                temperature=temperature,
+                beam_size=beam_size,
+                initial_prompt=initial_prompt,
+                include_segments=include_segments
+            ),
+            limiter=TRANSCRIBE_LIMITER
         )
 
         logger.info(
@@ -231,14 +300,14 @@ async def transcribe_audio(
 
 
 @app.exception_handler(HTTPException)
-async def http_exception_handler(request, exc: HTTPException):
+async def http_exception_handler(request: Request, exc: HTTPException):
     """Custom exception handler for consistent error responses."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=ErrorResponse(
             error=exc.__class__.__name__,
             detail=exc.detail,
-            request_id=generate_request_id()
+            request_id=getattr(request.state, "request_id", None) or generate_request_id()
         ).model_dump()
     )
 
@@ -2,14 +2,41 @@
 
 import time
 import threading
-from typing import Optional, List, Tuple
+from typing import BinaryIO, Optional, List, Tuple, Union
+import ctranslate2
 from faster_whisper import WhisperModel
 import structlog
 from app.config import settings
 from app.models import TranscriptionSegment
 
+__all__ = ["TranscriptionService", "transcription_service"]
+
 logger = structlog.get_logger()
 
+# Transcription defaults resolved once at import (settings are immutable at runtime)
+DEFAULT_LANGUAGE = settings.default_language
+DEFAULT_TEMPERATURE = settings.default_temperature
+DEFAULT_BEAM_SIZE = settings.default_beam_size
+VAD_FILTER = settings.enable_vad_filter
+VAD_PARAMETERS = {
+    "min_silence_duration_ms": settings.vad_min_silence_duration_ms,
+    "speech_pad_ms": settings.vad_speech_pad_ms,
+}
+
+
+def _resolve_device(device: str) -> str:
+    """Resolve 'auto' to 'cuda' when a CUDA device is visible, else 'cpu'."""
+    if device != "auto":
+        return device
+    return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+
+
+def _resolve_compute_type(compute_type: str, device: str) -> str:
+    """Resolve 'auto' to int8_float16 on GPU (tensor cores) and int8 on CPU."""
+    if compute_type != "auto":
+        return compute_type
+    return "int8_float16" if device == "cuda" else "int8"
+
 
 class TranscriptionService:
     """Manages Whisper model and transcription operations."""
@@ -18,64 +45,67 @@ class TranscriptionService:
         """Initialize the transcription service."""
         self.model: Optional[WhisperModel] = None
         self.model_name = settings.whisper_model
-        self.device = settings.whisper_device
-        self.compute_type = settings.whisper_compute_type
+        self.device = _resolve_device(settings.whisper_device)
+        self.compute_type = _resolve_compute_type(settings.whisper_compute_type, self.device)
+        self.num_workers = settings.whisper_num_workers
+        self.cpu_threads = settings.whisper_cpu_threads
         self.loading = False
         self.load_error: Optional[str] = None
         self._load_lock = threading.Lock()
+        self._ready = threading.Event()  # Set once loading finishes (success or failure)
 
     def load_model_async(self) -> None:
         """Start loading the Whisper model in a background thread."""
-        if self.model is not None or self.loading:
-            return  # Already loaded or loading
+        with self._load_lock:
+            if self.model is not None or self.loading or self.load_error:
+                return  # Already loaded, loading or failed
 
-        def _load():
-            with self._load_lock:
-                if self.model is not None:
-                    return  # Another thread already loaded it
-
-                self.loading = True
-                try:
-                    logger.info(
-                        "Loading Whisper model in background",
-                        model=self.model_name,
-                        device=self.device,
-                        compute_type=self.compute_type
-                    )
+            # Mark as loading before the thread starts so early requests wait for it
+            self.loading = True
 
-                    self.model = WhisperModel(
-                        self.model_name,
-                        device=self.device,
-                        compute_type=self.compute_type
-                    )
-
-                    logger.info("Whisper model loaded successfully")
-
-                except Exception as e:
-                    error_msg = f"Failed to load Whisper model: {str(e)}"
-                    logger.error("Failed to load Whisper model", error=str(e))
-                    self.load_error = error_msg
-                finally:
-                    self.loading = False
+        def _load():
+            try:
+                logger.info(
+                    "Loading Whisper model in background",
+                    model=self.model_name,
+                    device=self.device,
+                    compute_type=self.compute_type,
+                    num_workers=self.num_workers,
+                    cpu_threads=self.cpu_threads
+                )
+
+                self.model = WhisperModel(
+                    self.model_name,
+                    device=self.device,
+                    compute_type=self.compute_type,
+                    cpu_threads=self.cpu_threads,
+                    num_workers=self.num_workers
+                )
+
+                logger.info("Whisper model loaded successfully")
+
+            except Exception as e:
+                error_msg = f"Failed to load Whisper model: {str(e)}"
+                logger.error("Failed to load Whisper model", error=str(e))
+                self.load_error = error_msg
+            finally:
+                self.loading = False
+                self._ready.set()
 
         thread = threading.Thread(target=_load, daemon=True)
         thread.start()
 
     def wait_for_model(self, timeout: int = 120) -> None:
         """Wait for the model to finish loading."""
-        start_time = time.time()
-        while self.model is None and self.loading and time.time() - start_time < timeout:
-            time.sleep(0.5)
+        if not self._ready.wait(timeout):
+            raise RuntimeError("Model loading timeout")
 
         if self.load_error:
             raise RuntimeError(self.load_error)
 
-        if self.model is None:
-            raise RuntimeError("Model loading timeout or model not started")
-
     def transcribe(
         self,
-        audio_path: str,
+        audio: Union[str, BinaryIO],
         language: Optional[str] = None,
         temperature: Optional[float] = None,
         beam_size: Optional[int] = None,
@@ -86,7 +116,7 @@ class TranscriptionService:
         Transcribe an audio file.
 
         Args:
-            audio_path: Path to the audio file
+            audio: Path to the audio file or a binary file-like object
             language: Language code (e.g., 'it', 'en'). Auto-detected if None.
             temperature: Sampling temperature (0.0-1.0)
             beam_size: Beam size for decoding
@@ -99,22 +129,23 @@ class TranscriptionService:
         Raises:
             Exception: If transcription fails
         """
-        # Wait for model to finish loading if it's still loading
+        # Wait for model to finish loading (starting it if the lifespan hook did not)
         if not self.model:
             logger.info("Model not ready, waiting for background loading to complete...")
+            self.load_model_async()
             self.wait_for_model()
 
-        # Use defaults from settings if not provided
-        language = language or settings.default_language
-        temperature = temperature if temperature is not None else settings.default_temperature
-        beam_size = beam_size or settings.default_beam_size
+        # Use defaults if not provided
+        language = language or DEFAULT_LANGUAGE
+        temperature = temperature if temperature is not None else DEFAULT_TEMPERATURE
+        beam_size = beam_size or DEFAULT_BEAM_SIZE
 
         start_time = time.time()
 
         try:
             logger.info(
                 "Starting transcription",
-                audio_path=audio_path,
+                audio_path=audio if isinstance(audio, str) else None,
                 language=language,
                 temperature=temperature,
                 beam_size=beam_size,
@@ -123,12 +154,13 @@ class TranscriptionService:
 
             # Perform transcription
             segments_iter, info = self.model.transcribe(
-                audio_path,
+                audio,
                 language=language,
                 temperature=temperature,
                 beam_size=beam_size,
                 initial_prompt=initial_prompt,
-                vad_filter=settings.enable_vad_filter,
+                vad_filter=VAD_FILTER,
+                vad_parameters=VAD_PARAMETERS,
                 word_timestamps=False  # Disable for faster processing
             )
 
@@ -137,15 +169,17 @@ class TranscriptionService:
             full_text_parts = []
 
             for segment in segments_iter:
-                full_text_parts.append(segment.text.strip())
+                text = segment.text.strip()
+                full_text_parts.append(text)
 
                 if include_segments:
+                    # Fields come straight from faster-whisper, skip validation
                     segments_list.append(
-                        TranscriptionSegment(
+                        TranscriptionSegment.model_construct(
                             id=segment.id,
                             start=segment.start,
                             end=segment.end,
-                            text=segment.text.strip()
+                            text=text
                         )
                     )
 
@@ -173,7 +207,11 @@ class TranscriptionService:
             )
 
         except Exception as e:
-            logger.error("Transcription failed", error=str(e), audio_path=audio_path)
+            logger.error(
+                "Transcription failed",
+                error=str(e),
+                audio_path=audio if isinstance(audio, str) else None
+            )
             raise Exception(f"Transcription failed: {str(e)}")
 
     def get_model_info(self) -> dict:
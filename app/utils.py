@@ -1,25 +1,44 @@
 """Utility functions for file validation and processing."""
 
 import os
-import uuid
-from pathlib import Path
+import secrets
+import aiofiles
+import aiofiles.tempfile
 from typing import Tuple
 from fastapi import UploadFile, HTTPException, status
 from app.config import settings
 
+# Read uploads in 1 MiB chunks to keep syscalls and event loop awaits low
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Directory for staged uploads (Docker limits /dev/shm to 64MB by default)
+TEMP_DIR = settings.upload_temp_dir
+
+# Upload size limits resolved once at import
+MAX_FILE_SIZE_BYTES = settings.max_file_size_bytes
+MAX_FILE_SIZE_MB = settings.max_file_size_mb
+
 
 def generate_request_id() -> str:
     """Generate a unique request ID for logging and tracing."""
-    return str(uuid.uuid4())
+    return secrets.token_hex(8)
+
 
+def _ext(filename: str) -> str:
+    """Return the lowercase file extension without the leading dot."""
+    return os.path.splitext(filename)[1][1:].lower()
 
-def validate_audio_file(file: UploadFile) -> None:
+
+def validate_audio_file(file: UploadFile) -> str:
     """
     Validate uploaded audio file.
 
     Args:
         file: Uploaded file from request
 
+    Returns:
+        The validated lowercase file extension (without dot)
+
     Raises:
         HTTPException: If file is invalid (wrong format, too large, etc.)
     """
@@ -37,23 +56,53 @@ def validate_audio_file(file: UploadFile) -> None:
         )
 
     # Extract file extension
-    file_ext = Path(file.filename).suffix.lstrip('.').lower()
+    file_ext = _ext(file.filename)
 
     # Check if format is allowed
-    allowed_formats = settings.allowed_formats_list
+    allowed_formats = settings.allowed_formats_set
     if file_ext not in allowed_formats:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Unsupported audio format: {file_ext}. Allowed formats: {', '.join(allowed_formats)}"
+            detail=f"Unsupported audio format: {file_ext}. Allowed formats: {', '.join(sorted(allowed_formats))}"
+        )
+
+    return file_ext
+
+
+def check_upload_size(file: UploadFile) -> int:
+    """
+    Check the size of an upload already staged by Starlette and rewind it.
+
+    Args:
+        file: Uploaded file from request
+
+    Returns:
+        File size in bytes
+
+    Raises:
+        HTTPException: If file is too large
+    """
+    file_size = file.size
+    if file_size is None:
+        file_size = file.file.seek(0, os.SEEK_END)
+    file.file.seek(0)
+
+    if file_size > MAX_FILE_SIZE_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large. Maximum size: {MAX_FILE_SIZE_MB}MB"
         )
 
+    return file_size
+
 
-async def save_upload_to_temp(file: UploadFile) -> Tuple[str, int]:
+async def save_upload_to_temp(file: UploadFile, file_ext: str = "") -> Tuple[str, int]:
     """
-    Save uploaded file to /tmp directory.
+    Save uploaded file to a temp file in the configured upload directory.
 
     Args:
         file: Uploaded file from request
+        file_ext: Validated file extension (without dot) for the temp filename
 
     Returns:
         Tuple of (temp_file_path, file_size_bytes)
@@ -61,43 +110,49 @@ async def save_upload_to_temp(file: UploadFile) -> Tuple[str, int]:
     Raises:
         HTTPException: If file is too large or cannot be saved
     """
-    # Generate unique filename
-    file_ext = Path(file.filename).suffix if file.filename else ""
-    temp_filename = f"audio_{uuid.uuid4()}{file_ext}"
-    temp_path = os.path.join("/tmp", temp_filename)
+    suffix = f".{file_ext}" if file_ext else ""
+    temp_path = None
 
     # Read and save file with size check
     file_size = 0
-    max_size = settings.max_file_size_bytes
+    max_size = MAX_FILE_SIZE_BYTES
+
+    # Reject early when the declared size already exceeds the limit
+    if file.size is not None and file.size > max_size:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large. Maximum size: {MAX_FILE_SIZE_MB}MB"
+        )
 
     try:
-        with open(temp_path, "wb") as temp_file:
-            while chunk := await file.read(8192):  # Read in 8KB chunks
+        async with aiofiles.tempfile.NamedTemporaryFile(
+            "wb", prefix="audio_", suffix=suffix, dir=TEMP_DIR, delete=False
+        ) as temp_file:
+            temp_path = temp_file.name
+
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
                 file_size += len(chunk)
 
                 # Check file size limit
                 if file_size > max_size:
-                    # Clean up partial file
-                    temp_file.close()
-                    if os.path.exists(temp_path):
-                        os.remove(temp_path)
-
-                    max_mb = settings.max_file_size_mb
                     raise HTTPException(
                         status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                        detail=f"File too large. Maximum size: {max_mb}MB"
+                        detail=f"File too large. Maximum size: {MAX_FILE_SIZE_MB}MB"
                     )
 
-                temp_file.write(chunk)
+                await temp_file.write(chunk)
 
         return temp_path, file_size
 
     except HTTPException:
+        # Clean up partial file
+        if temp_path:
+            cleanup_temp_file(temp_path)
         raise
     except Exception as e:
         # Clean up on error
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
+        if temp_path:
+            cleanup_temp_file(temp_path)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to save uploaded file: {str(e)}"
@@ -106,7 +161,7 @@ async def save_upload_to_temp(file: UploadFile) -> Tuple[str, int]:
 
 def cleanup_temp_file(file_path: str) -> None:
     """
-    Remove temporary file from /tmp.
+    Remove a temporary upload file.
 
     Args:
         file_path: Path to temporary file
@@ -6,11 +6,12 @@ This script downloads the faster-whisper model during Docker build time
 to avoid runtime downloads and reduce cold start time on Cloud Run.
 """
 
+import os
 import sys
 from faster_whisper import WhisperModel
 
-# Model configuration (matches app/config.py defaults)
-MODEL_NAME = "small"
+# Model configuration (matches app/config.py defaults, overridable via env)
+MODEL_NAME = os.getenv("WHISPER_MODEL", "small")
 DEVICE = "cpu"  # Use CPU during build, GPU will be used at runtime
 COMPUTE_TYPE = "int8"
 